@@ -1,163 +1,446 @@
-import ee
-import os
-import requests
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from dotenv import load_dotenv
-
-# --- INITIALIZATION ---
-
-# Load environment variables from .env file
-load_dotenv()
-OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
-GOOGLE_CLOUD_PROJECT = os.getenv("GOOGLE_CLOUD_PROJECT")
-
-# Initialize the FastAPI app
-app = FastAPI(title="HealthyCity API")
-
-# Add CORS middleware to allow requests from your Streamlit frontend
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Allows all origins
-    allow_credentials=True,
-    allow_methods=["*"],  # Allows all methods
-    allow_headers=["*"],  # Allows all headers
-)
-
-# Authenticate and initialize Google Earth Engine
-try:
-    if not GOOGLE_CLOUD_PROJECT:
-        raise ValueError("GOOGLE_CLOUD_PROJECT environment variable not set.")
-    ee.Initialize(project=GOOGLE_CLOUD_PROJECT)
-    print("✅ Google Earth Engine Initialized Successfully.")
-except Exception as e:
-    print(f"❌ ERROR: Google Earth Engine failed to initialize. Details: {e}")
-    # You might want to handle this more gracefully in a real app
-    # For now, we print the error and continue, but GEE-dependent endpoints will fail.
-
-
-# --- HELPER FUNCTIONS ---
-
-def get_city_coords(city_name: str):
-    """Get latitude and longitude for a city using OpenWeatherMap Geocoding API."""
-    if not OPENWEATHER_API_KEY:
-        raise HTTPException(status_code=500, detail="OpenWeatherMap API key is not configured on the server.")
-    geo_url = f"http://api.openweathermap.org/geo/1.0/direct?q={city_name}&limit=1&appid={OPENWEATHER_API_KEY}"
-    response = requests.get(geo_url)
-    if response.status_code != 200:
-        raise HTTPException(status_code=500, detail="Failed to connect to Geocoding service.")
-    
-    data = response.json()
-    if not data:
-        raise HTTPException(status_code=404, detail=f"City '{city_name}' not found.")
-    
-    return data[0]["lat"], data[0]["lon"]
-
-
-# --- API ENDPOINTS ---
-
-@app.get("/")
-def read_root():
-    return {"message": "Welcome to the HealthyCity API. See /docs for endpoint details."}
-
-
-@app.get("/city/{city}/green")
-def get_green_cover(city: str):
-    """
-    Calculates the average Normalized Difference Vegetation Index (NDVI) for a city
-    using Sentinel-2 satellite imagery.
-    """
-    try:
-        lat, lon = get_city_coords(city)
-        point = ee.Geometry.Point(lon, lat)
-        region = point.buffer(2000)  # 2km buffer around the city center
-
-        # Use Sentinel-2 imagery, filter for recent, low-cloud images
-        collection = (ee.ImageCollection('COPERNICUS/S2_SR_HARMONIZED')
-                      .filterBounds(region)
-                      .filterDate('2023-01-01', '2023-12-31')
-                      .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 20))
-                      .sort('CLOUDY_PIXEL_PERCENTAGE'))
-
-        image = collection.first() # Get the clearest image
-
-        # Calculate NDVI: (NIR - Red) / (NIR + Red)
-        # For Sentinel-2, NIR is band B8, Red is band B4
-        ndvi = image.normalizedDifference(['B8', 'B4']).rename('NDVI')
-        
-        # Calculate the average NDVI in the region
-        stats = ndvi.reduceRegion(
-            reducer=ee.Reducer.mean(),
-            geometry=region,
-            scale=10,
-            maxPixels=1e9
-        )
-        
-        avg_ndvi = stats.get('NDVI').getInfo()
-        if avg_ndvi is None:
-            raise HTTPException(status_code=404, detail=f"Could not compute NDVI for {city}. No clear satellite imagery might be available.")
-        
-        # Simple conversion to a percentage-like score
-        green_cover_percentage = (avg_ndvi + 1) * 50
-
-        return {
-            "city": city.title(),
-            "location": {"lat": lat, "lon": lon},
-            "avg_ndvi": avg_ndvi,
-            "green_cover_percentage": green_cover_percentage,
-            "data_source": "Copernicus Sentinel-2",
-        }
-    except HTTPException as e:
-        raise e # Re-raise HTTPException from get_city_coords
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An error occurred with Google Earth Engine: {str(e)}")
-
-
-@app.get("/city/{city}/heatmap")
-def get_heat_map(city: str):
-    """
-    Calculates the average Land Surface Temperature (LST) for a city using Landsat 8.
-    """
-    try:
-        lat, lon = get_city_coords(city)
-        point = ee.Geometry.Point(lon, lat)
-        region = point.buffer(2000)
-
-        # Use Landsat 8 imagery
-        collection = (ee.ImageCollection('LANDSAT/LC08/C02/T1_L2')
-                      .filterBounds(region)
-                      .filterDate('2023-01-01', '2023-12-31')
-                      .filter(ee.Filter.lt('CLOUD_COVER', 20))
-                      .sort('CLOUD_COVER'))
-
-        image = collection.first()
-        
-        # Select thermal band (Band 10), apply scale factor, and convert from Kelvin to Celsius
-        lst = (image.select('ST_B10')
-               .multiply(0.00341802)
-               .add(149.0)
-               .subtract(273.15)
-               .rename('LST_Celsius'))
-
-        stats = lst.reduceRegion(
-            reducer=ee.Reducer.mean(),
-            geometry=region,
-            scale=30,
-            maxPixels=1e9
-        )
-        
-        avg_lst_celsius = stats.get('LST_Celsius').getInfo()
-        if avg_lst_celsius is None:
-            raise HTTPException(status_code=404, detail=f"Could not compute LST for {city}. No clear satellite imagery might be available.")
-
-        return {
-            "city": city.title(),
-            "location": {"lat": lat, "lon": lon},
-            "avg_lst_celsius": avg_lst_celsius,
-            "data_source": "USGS Landsat 8",
-        }
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An error occurred with Google Earth Engine: {str(e)}")
-
+import asyncio
+import concurrent.futures
+import ee
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+
+import diskcache
+import httpx
+from cachetools import TTLCache
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from dotenv import load_dotenv
+
+# --- INITIALIZATION ---
+
+# Load environment variables from .env file
+load_dotenv()
+OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
+GOOGLE_CLOUD_PROJECT = os.getenv("GOOGLE_CLOUD_PROJECT")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Share one HTTP client (and its connection pool) across all requests
+    # instead of opening a fresh TCP+TLS connection per geocoding call.
+    app.state.http = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=30,
+    )
+    # Warm the external connections before user traffic arrives: the first
+    # getInfo() of a process pays GEE auth/handshake costs, and the first
+    # OWM call pays DNS + connection setup. Failures here are non-fatal.
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(GEE_POOL, ee.Number(1).getInfo)
+    except Exception as e:
+        print(f"⚠️  WARNING: GEE warm-up call failed: {e}")
+    try:
+        await app.state.http.head("http://api.openweathermap.org/geo/1.0/direct", timeout=5)
+    except Exception as e:
+        print(f"⚠️  WARNING: OpenWeatherMap warm-up call failed: {e}")
+    yield
+    await app.state.http.aclose()
+
+
+# Initialize the FastAPI app
+app = FastAPI(title="HealthyCity API", lifespan=lifespan)
+
+# Add CORS middleware to allow requests from your Streamlit frontend
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],  # Allows all origins
+    allow_credentials=True,
+    allow_methods=["*"],  # Allows all methods
+    allow_headers=["*"],  # Allows all headers
+)
+
+# Compress JSON responses above half a KB; httpx on the Streamlit side
+# decodes gzip transparently.
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+# Authenticate and initialize Google Earth Engine
+try:
+    if not GOOGLE_CLOUD_PROJECT:
+        raise ValueError("GOOGLE_CLOUD_PROJECT environment variable not set.")
+    ee.Initialize(project=GOOGLE_CLOUD_PROJECT)
+    print("✅ Google Earth Engine Initialized Successfully.")
+except Exception as e:
+    print(f"❌ ERROR: Google Earth Engine failed to initialize. Details: {e}")
+    # You might want to handle this more gracefully in a real app
+    # For now, we print the error and continue, but GEE-dependent endpoints will fail.
+
+
+# --- HELPER FUNCTIONS ---
+
+# GEE results over our fixed 2023 date range and 2km buffer are deterministic
+# per city, so warm keys can be served straight from a 24h TTL cache instead
+# of paying the multi-second getInfo() round-trip again.
+RESULT_CACHE_TTL = 86400
+RESULT_CACHE = TTLCache(maxsize=512, ttl=RESULT_CACHE_TTL)
+RESULT_CACHE_LOCK = threading.Lock()
+
+# Entries older than TTL - REFRESH_AHEAD are served immediately but also
+# recomputed in the background (stale-while-revalidate), so no user request
+# ever pays the full GEE penalty for a city we have seen before.
+REFRESH_AHEAD = 3600
+
+# Keys with a refresh already in flight; stops concurrent hits on the same
+# stale entry from queueing duplicate GEE recomputations.
+_REFRESHING: set[tuple[str, str]] = set()
+
+# getInfo() blocks for seconds while Google's servers compute; run it in a
+# dedicated pool so the event loop stays responsive under concurrent users.
+# Sized to stay within GEE's per-user concurrency limits.
+GEE_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=16)
+
+# A second, on-disk layer keeps expensive GEE results across process restarts
+# (e.g. redeploys or autoscaling), turning a cold start for a known city into
+# a file read instead of a fresh GEE computation.
+DISK_CACHE_DIR = os.getenv("HEALTHYCITY_CACHE_DIR", "/var/cache/healthycity")
+DISK_CACHE_EXPIRE = 30 * 86400  # 30 days
+try:
+    DISK_CACHE = diskcache.Cache(DISK_CACHE_DIR)
+except Exception as e:
+    print(f"⚠️  WARNING: Could not open disk cache at {DISK_CACHE_DIR}: {e}")
+    DISK_CACHE = None
+
+
+def _disk_key(endpoint: str, city: str) -> str:
+    return f"{endpoint}:{city.strip().lower()}:2023"
+
+
+def _cached_result(endpoint: str, city: str):
+    """Look up the cached response for (endpoint, city).
+
+    Returns (result, needs_refresh); result is None on a miss, and
+    needs_refresh is True when the entry is close enough to expiry that it
+    should be recomputed in the background.
+    """
+    with RESULT_CACHE_LOCK:
+        entry = RESULT_CACHE.get((endpoint, city.strip().lower()))
+    if entry is None and DISK_CACHE is not None:
+        entry = DISK_CACHE.get(_disk_key(endpoint, city))
+        if entry is not None:
+            # Promote disk hits back into the in-process cache
+            with RESULT_CACHE_LOCK:
+                RESULT_CACHE[(endpoint, city.strip().lower())] = entry
+    if entry is None:
+        return None, False
+    age = time.time() - entry["stored_at"]
+    return entry["data"], age > RESULT_CACHE_TTL - REFRESH_AHEAD
+
+
+def _store_result(endpoint: str, city: str, result: dict):
+    """Store a computed response under (endpoint, city)."""
+    entry = {"data": result, "stored_at": time.time()}
+    with RESULT_CACHE_LOCK:
+        RESULT_CACHE[(endpoint, city.strip().lower())] = entry
+    if DISK_CACHE is not None:
+        DISK_CACHE.set(_disk_key(endpoint, city), entry, expire=DISK_CACHE_EXPIRE)
+
+
+# City -> (lat, lon) is effectively static, so cache successful lookups and
+# skip the OpenWeatherMap round-trip on repeat requests.
+_GEOCODE_CACHE: dict[str, tuple[float, float]] = {}
+
+# Geocoding is a small, fast call: a hung OWM connection must not tie up a
+# request for the shared client's full 30s. Keep timeouts tight and retry
+# transient failures with a short exponential backoff instead.
+GEO_TIMEOUT = httpx.Timeout(5.0, connect=1.0, read=3.0)
+GEO_RETRIES = 2
+GEO_BACKOFF = 0.2
+_GEO_RETRY_STATUSES = (502, 503, 504)
+
+
+async def get_city_coords(client: httpx.AsyncClient, city_name: str):
+    """Get latitude and longitude for a city using OpenWeatherMap Geocoding API."""
+    if not OPENWEATHER_API_KEY:
+        raise HTTPException(status_code=500, detail="OpenWeatherMap API key is not configured on the server.")
+    city_key = city_name.strip().lower()
+    if city_key in _GEOCODE_CACHE:
+        return _GEOCODE_CACHE[city_key]
+
+    geo_url = f"http://api.openweathermap.org/geo/1.0/direct?q={city_name}&limit=1&appid={OPENWEATHER_API_KEY}"
+    response = None
+    for attempt in range(GEO_RETRIES + 1):
+        try:
+            response = await client.get(geo_url, timeout=GEO_TIMEOUT)
+        except httpx.TransportError:
+            response = None
+        if response is not None and response.status_code not in _GEO_RETRY_STATUSES:
+            break
+        if attempt < GEO_RETRIES:
+            await asyncio.sleep(GEO_BACKOFF * (2 ** attempt))
+    if response is None or response.status_code != 200:
+        raise HTTPException(status_code=500, detail="Failed to connect to Geocoding service.")
+
+    data = response.json()
+    if not data:
+        raise HTTPException(status_code=404, detail=f"City '{city_name}' not found.")
+
+    coords = (data[0]["lat"], data[0]["lon"])
+    _GEOCODE_CACHE[city_key] = coords
+    return coords
+
+
+# --- GEE PIPELINES ---
+# These helpers only build lazy server-side expressions; nothing is computed
+# until getInfo() is called, so a caller can combine several of them into a
+# single round-trip.
+
+# Reduce NDVI at 30m rather than Sentinel-2's native 10m: 9x fewer pixels for
+# GEE to evaluate per request, with negligible effect on a regional mean.
+NDVI_SCALE_M = 30
+
+
+def _city_region(lat: float, lon: float):
+    """Build the analysis region: a 2km buffer around the city center."""
+    return ee.Geometry.Point(lon, lat).buffer(2000)
+
+
+def _base_collections():
+    """Build the date- and cloud-filtered collections that don't depend on the city.
+
+    This is the part of the GEE expression we can prepare while the
+    geocoding request is still in flight; the city-specific filterBounds
+    is applied once the coordinates arrive.
+    """
+    # Use Sentinel-2 imagery, filter for recent, low-cloud images
+    s2 = (ee.ImageCollection('COPERNICUS/S2_SR_HARMONIZED')
+          .filterDate('2023-01-01', '2023-12-31')
+          .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 20)))
+
+    # Use Landsat 8 imagery
+    l8 = (ee.ImageCollection('LANDSAT/LC08/C02/T1_L2')
+          .filterDate('2023-01-01', '2023-12-31')
+          .filter(ee.Filter.lt('CLOUD_COVER', 20)))
+
+    return s2, l8
+
+
+async def _locate_and_prepare(client: httpx.AsyncClient, city: str):
+    """Resolve city coordinates and build the base collections concurrently."""
+    loop = asyncio.get_running_loop()
+    (lat, lon), (s2, l8) = await asyncio.gather(
+        get_city_coords(client, city),
+        loop.run_in_executor(None, _base_collections),
+    )
+    return lat, lon, s2, l8
+
+
+def _ndvi_stats(region, s2):
+    """Build the mean-NDVI reducer over a region from Sentinel-2 imagery."""
+    # Median composite of the low-cloud images: avoids sorting the whole
+    # year's collection server-side and is more robust than a single scene
+    image = s2.filterBounds(region).median()
+
+    # Calculate NDVI: (NIR - Red) / (NIR + Red)
+    # For Sentinel-2, NIR is band B8, Red is band B4
+    ndvi = image.normalizedDifference(['B8', 'B4']).rename('NDVI')
+
+    # Calculate the average NDVI in the region
+    return ndvi.reduceRegion(
+        reducer=ee.Reducer.mean(),
+        geometry=region,
+        scale=NDVI_SCALE_M,
+        maxPixels=1e9
+    )
+
+
+def _lst_stats(region, l8):
+    """Build the mean land-surface-temperature reducer over a region from Landsat 8."""
+    image = l8.filterBounds(region).median()
+
+    # Select thermal band (Band 10), apply scale factor, and convert from Kelvin to Celsius
+    lst = (image.select('ST_B10')
+           .multiply(0.00341802)
+           .add(149.0)
+           .subtract(273.15)
+           .rename('LST_Celsius'))
+
+    return lst.reduceRegion(
+        reducer=ee.Reducer.mean(),
+        geometry=region,
+        scale=30,
+        maxPixels=1e9
+    )
+
+
+async def _compute_green(client: httpx.AsyncClient, city: str):
+    """Run the NDVI pipeline for a city and store the response in the cache."""
+    lat, lon, s2, _ = await _locate_and_prepare(client, city)
+    region = _city_region(lat, lon)
+
+    loop = asyncio.get_running_loop()
+    avg_ndvi = await loop.run_in_executor(GEE_POOL, _ndvi_stats(region, s2).get('NDVI').getInfo)
+    if avg_ndvi is None:
+        raise HTTPException(status_code=404, detail=f"Could not compute NDVI for {city}. No clear satellite imagery might be available.")
+
+    # Simple conversion to a percentage-like score
+    green_cover_percentage = (avg_ndvi + 1) * 50
+
+    display_city = city.title()
+    result = {
+        "city": display_city,
+        "location": {"lat": lat, "lon": lon},
+        "avg_ndvi": avg_ndvi,
+        "green_cover_percentage": green_cover_percentage,
+        "data_source": "Copernicus Sentinel-2",
+    }
+    _store_result("green", city, result)
+    return result
+
+
+async def _compute_heat(client: httpx.AsyncClient, city: str):
+    """Run the LST pipeline for a city and store the response in the cache."""
+    lat, lon, _, l8 = await _locate_and_prepare(client, city)
+    region = _city_region(lat, lon)
+
+    loop = asyncio.get_running_loop()
+    avg_lst_celsius = await loop.run_in_executor(GEE_POOL, _lst_stats(region, l8).get('LST_Celsius').getInfo)
+    if avg_lst_celsius is None:
+        raise HTTPException(status_code=404, detail=f"Could not compute LST for {city}. No clear satellite imagery might be available.")
+
+    display_city = city.title()
+    result = {
+        "city": display_city,
+        "location": {"lat": lat, "lon": lon},
+        "avg_lst_celsius": avg_lst_celsius,
+        "data_source": "USGS Landsat 8",
+    }
+    _store_result("heatmap", city, result)
+    return result
+
+
+async def _compute_combined(client: httpx.AsyncClient, city: str):
+    """Run both pipelines for a city in one getInfo() and cache the response."""
+    lat, lon, s2, l8 = await _locate_and_prepare(client, city)
+    region = _city_region(lat, lon)
+
+    # Fuse both reducers into one server-side dictionary so a single
+    # getInfo() evaluates them together instead of two round-trips.
+    loop = asyncio.get_running_loop()
+    stats = await loop.run_in_executor(GEE_POOL, ee.Dictionary({
+        'ndvi': _ndvi_stats(region, s2),
+        'lst': _lst_stats(region, l8),
+    }).getInfo)
+
+    avg_ndvi = stats['ndvi'].get('NDVI')
+    avg_lst_celsius = stats['lst'].get('LST_Celsius')
+    if avg_ndvi is None or avg_lst_celsius is None:
+        raise HTTPException(status_code=404, detail=f"Could not compute NDVI/LST for {city}. No clear satellite imagery might be available.")
+
+    # Simple conversion to a percentage-like score
+    green_cover_percentage = (avg_ndvi + 1) * 50
+
+    display_city = city.title()
+    result = {
+        "city": display_city,
+        "location": {"lat": lat, "lon": lon},
+        "avg_ndvi": avg_ndvi,
+        "green_cover_percentage": green_cover_percentage,
+        "avg_lst_celsius": avg_lst_celsius,
+        "data_sources": ["Copernicus Sentinel-2", "USGS Landsat 8"],
+    }
+    _store_result("combined", city, result)
+    return result
+
+
+_COMPUTE = {
+    "green": _compute_green,
+    "heatmap": _compute_heat,
+    "combined": _compute_combined,
+}
+
+
+def _claim_refresh(endpoint: str, city: str) -> bool:
+    """Atomically claim the refresh for a key; False if one is already pending."""
+    key = (endpoint, city.strip().lower())
+    with RESULT_CACHE_LOCK:
+        if key in _REFRESHING:
+            return False
+        _REFRESHING.add(key)
+        return True
+
+
+async def _refresh_result(endpoint: str, city: str, client: httpx.AsyncClient):
+    """Recompute a nearly-expired cache entry so the next miss stays a hit."""
+    try:
+        await _COMPUTE[endpoint](client, city)
+    except Exception as e:
+        # The stale entry is still being served; just log and try again later.
+        print(f"⚠️  WARNING: background refresh of {endpoint}:{city} failed: {e}")
+    finally:
+        with RESULT_CACHE_LOCK:
+            _REFRESHING.discard((endpoint, city.strip().lower()))
+
+
+# --- API ENDPOINTS ---
+
+@app.get("/")
+def read_root():
+    return {"message": "Welcome to the HealthyCity API. See /docs for endpoint details."}
+
+
+@app.get("/city/{city}/green")
+async def get_green_cover(city: str, request: Request, background_tasks: BackgroundTasks):
+    """
+    Calculates the average Normalized Difference Vegetation Index (NDVI) for a city
+    using Sentinel-2 satellite imagery.
+    """
+    cached, needs_refresh = _cached_result("green", city)
+    if cached is not None:
+        if needs_refresh and _claim_refresh("green", city):
+            background_tasks.add_task(_refresh_result, "green", city, request.app.state.http)
+        return cached
+
+    try:
+        return await _compute_green(request.app.state.http, city)
+    except HTTPException as e:
+        raise e # Re-raise HTTPException from get_city_coords
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"An error occurred with Google Earth Engine: {str(e)}")
+
+
+@app.get("/city/{city}/heatmap")
+async def get_heat_map(city: str, request: Request, background_tasks: BackgroundTasks):
+    """
+    Calculates the average Land Surface Temperature (LST) for a city using Landsat 8.
+    """
+    cached, needs_refresh = _cached_result("heatmap", city)
+    if cached is not None:
+        if needs_refresh and _claim_refresh("heatmap", city):
+            background_tasks.add_task(_refresh_result, "heatmap", city, request.app.state.http)
+        return cached
+
+    try:
+        return await _compute_heat(request.app.state.http, city)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"An error occurred with Google Earth Engine: {str(e)}")
+
+
+@app.get("/city/{city}/combined")
+async def get_combined(city: str, request: Request, background_tasks: BackgroundTasks):
+    """
+    Calculates both average NDVI and average LST for a city in a single
+    Google Earth Engine round-trip (one getInfo() for both reducers).
+    """
+    cached, needs_refresh = _cached_result("combined", city)
+    if cached is not None:
+        if needs_refresh and _claim_refresh("combined", city):
+            background_tasks.add_task(_refresh_result, "combined", city, request.app.state.http)
+        return cached
+
+    try:
+        return await _compute_combined(request.app.state.http, city)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"An error occurred with Google Earth Engine: {str(e)}")
+